@@ -1,25 +1,259 @@
 import sys
 import os
 import re
+import html
 import shutil
-import multiprocessing
-from typing import Optional, Dict, Any, List, Tuple
-
-import yt_dlp
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+import sqlite3
+import pickle
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterator, List, Tuple
+
+# yt_dlp is imported on first use to keep startup fast. Its lazy
+# extractors cut that import time further; make sure they aren't disabled.
+os.environ.pop('YTDLP_NO_LAZY_EXTRACTORS', None)
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+from PyQt5.QtCore import Qt, QThread, QSettings, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, 
     QVBoxLayout, QHBoxLayout, QComboBox, QProgressBar, 
-    QFileDialog, QMessageBox, QCheckBox, QTabWidget, QTextEdit
+    QFileDialog, QMessageBox, QCheckBox, QTabWidget, QSpinBox
 )
 from PyQt5.QtGui import QIcon, QFont
 
+METADATA_CACHE_FILE = os.path.expanduser("~/.ytivs_meta_cache.sqlite3")
+METADATA_CACHE_TTL = 86400  # seconds
+METADATA_CACHE_MAX_ENTRIES = 2000
+MAX_URL_REDIRECTS = 5
+# Wrapper fields that must not override the resolved result, as in
+# yt-dlp's YoutubeDL.process_ie_result
+_URL_TRANSPARENT_EXEMPT_FIELDS = ('_type', 'url', 'id', 'extractor', 'extractor_key', 'ie_key')
+
+_PLATFORM_RE = re.compile(r'(youtube\.com|youtu\.be|instagram\.com|vimeo\.com|facebook\.com)')
+# {h} is replaced with a "[height<=N]" filter, or nothing for "Best Available"
+_YOUTUBE_FORMAT = 'bestvideo{h}[ext=mp4]+bestaudio[ext=m4a]/best{h}[ext=mp4]'
+_FORMAT_TABLE = {
+    'youtube.com': _YOUTUBE_FORMAT,
+    'youtu.be': _YOUTUBE_FORMAT,
+    'instagram.com': 'best[ext=mp4]',
+    'vimeo.com': 'best[ext=mp4]',
+    'facebook.com': 'best[ext=mp4]',
+}
+_DEFAULT_FORMAT = 'best[ext=mp4]'
+
+# Video codecs that can be stream-copied into an mp4 container
+_MP4_VIDEO_CODECS = ('avc1', 'h264', 'hev1', 'hvc1', 'h265', 'hevc', 'av01')
+
+_DEFAULT_CONCURRENT_FRAGS = min(16, (os.cpu_count() or 4))
+
+PROGRESS_EMIT_INTERVAL_NS = 33_000_000  # ~30 Hz
+
+APP_ICON_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.ico")
+
+class _PooledYDL:
+    """A pooled YoutubeDL instance with its lock and current progress hook."""
+    def __init__(self, ydl_opts: Dict[str, Any]):
+        import yt_dlp
+
+        self.lock = threading.Lock()
+        self.users = 0  # Borrowers holding or waiting on the lock
+        self.evicted = False
+        self.progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+        self.ydl = yt_dlp.YoutubeDL({**ydl_opts, 'progress_hooks': [self._dispatch]})
+
+    def _dispatch(self, d: Dict[str, Any]):
+        """Forward progress to whoever is currently using the instance."""
+        if self.progress_hook is not None:
+            self.progress_hook(d)
+
+class YDLPool:
+    """Process-wide cache of YoutubeDL instances keyed by their options.
+
+    Reusing an instance keeps its HTTP connection pool warm, so repeated
+    calls with the same options (e.g. several Fetch Info clicks) skip the
+    TCP/TLS handshake. Metadata fetches and downloads use different
+    options, so they do not share an instance.
+    """
+    DEFAULT_OPTS: Dict[str, Any] = {
+        'socket_timeout': 30,
+        'retries': 3,
+    }
+    MAX_INSTANCES = 8
+
+    _instances: "OrderedDict[str, _PooledYDL]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _opts_key(ydl_opts: Dict[str, Any]) -> str:
+        """Build a hashable key from an options dict."""
+        return repr(sorted(ydl_opts.items()))
+
+    @classmethod
+    @contextmanager
+    def get(
+        cls,
+        ydl_opts: Dict[str, Any],
+        progress_hook: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Iterator["yt_dlp.YoutubeDL"]:
+        """
+        Borrow the shared YoutubeDL instance for the given options.
+        
+        The instance is locked for the duration of the ``with`` block, as
+        YoutubeDL is not thread-safe.
+        
+        Args:
+            ydl_opts (Dict): yt-dlp options, excluding ``progress_hooks``
+            progress_hook (Callable): Optional hook for this use only
+        """
+        ydl_opts = {**cls.DEFAULT_OPTS, **ydl_opts}
+        key = cls._opts_key(ydl_opts)
+
+        to_close = []
+        with cls._lock:
+            pooled = cls._instances.get(key)
+            if pooled is None:
+                pooled = _PooledYDL(ydl_opts)
+                cls._instances[key] = pooled
+                while len(cls._instances) > cls.MAX_INSTANCES:
+                    _, evicted = cls._instances.popitem(last=False)
+                    evicted.evicted = True
+                    if evicted.users == 0:
+                        to_close.append(evicted)
+            else:
+                cls._instances.move_to_end(key)
+            pooled.users += 1
+        cls._close(to_close)
+
+        try:
+            with pooled.lock:
+                pooled.progress_hook = progress_hook
+                try:
+                    yield pooled.ydl
+                finally:
+                    pooled.progress_hook = None
+        finally:
+            # An instance evicted while borrowed is closed by its last user
+            with cls._lock:
+                pooled.users -= 1
+                to_close = [pooled] if pooled.evicted and pooled.users == 0 else []
+            cls._close(to_close)
+
+    @staticmethod
+    def _close(instances: List[_PooledYDL]):
+        """Release connection pools and save cookies of evicted instances."""
+        for pooled in instances:
+            try:
+                pooled.ydl.close()
+            except Exception as e:
+                print(f"YoutubeDL close error: {e}")
+
 class VideoMetadataExtractor:
     """Utility class to extract video metadata."""
+    _cache_lock = threading.Lock()
+
+    YDL_OPTS: Dict[str, Any] = {
+        'quiet': True,
+        'no_warnings': True,
+        'skipdownload': True,
+        'extract_flat': 'in_playlist',
+        'extractor_args': {'youtube': {'player_skip': ['configs']}},
+    }
+
+    @staticmethod
+    @contextmanager
+    def _open_cache() -> Iterator[sqlite3.Connection]:
+        """Open the on-disk metadata cache and commit on success.
+
+        A connection is opened per access, under ``_cache_lock``, because
+        sqlite connections can't be shared across threads.
+        """
+        with closing(sqlite3.connect(METADATA_CACHE_FILE)) as conn:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS metadata "
+                    "(key TEXT PRIMARY KEY, ts REAL NOT NULL, payload BLOB NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS metadata_ts ON metadata (ts)")
+                yield conn
+
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Hash a URL into a fixed-length cache key."""
+        return hashlib.blake2b(url.encode()).hexdigest()
+
+    @classmethod
+    def _cache_get(cls, url: str) -> Optional[Dict[str, Any]]:
+        """Return cached metadata for a URL if present and not expired."""
+        try:
+            with cls._cache_lock, cls._open_cache() as conn:
+                row = conn.execute(
+                    "SELECT ts, payload FROM metadata WHERE key = ?", (cls._cache_key(url),)
+                ).fetchone()
+            if row is None:
+                return None
+
+            timestamp, payload = row
+            if time.time() - timestamp >= METADATA_CACHE_TTL:
+                return None
+            return pickle.loads(payload)
+        except Exception:
+            return None
+
+    @classmethod
+    def _cache_put(cls, url: str, payload: Dict[str, Any]):
+        """Store metadata for a URL, evicting the oldest entries when full."""
+        try:
+            blob = pickle.dumps(payload)
+            with cls._cache_lock, cls._open_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, ts, payload) VALUES (?, ?, ?)",
+                    (cls._cache_key(url), time.time(), blob)
+                )
+                conn.execute(
+                    "DELETE FROM metadata WHERE key IN ("
+                    "SELECT key FROM metadata ORDER BY ts "
+                    "LIMIT max(0, (SELECT COUNT(*) FROM metadata) - ?))",
+                    (METADATA_CACHE_MAX_ENTRIES,)
+                )
+        except Exception as e:
+            print(f"Metadata cache error: {e}")
+
+    @classmethod
+    def invalidate(cls, url: str):
+        """Drop any cached metadata for a URL."""
+        try:
+            with cls._cache_lock, cls._open_cache() as conn:
+                conn.execute("DELETE FROM metadata WHERE key = ?", (cls._cache_key(url),))
+        except Exception as e:
+            print(f"Metadata cache error: {e}")
+
     @staticmethod
-    def extract_video_info(url: str) -> Dict[str, Any]:
+    def _summarize(info_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick the summary fields shown in the Video Info tab."""
+        thumbnail = info_dict.get('thumbnail')
+        if not thumbnail and info_dict.get('thumbnails'):
+            thumbnail = info_dict['thumbnails'][-1].get('url')
+
+        return {
+            'title': info_dict.get('title', 'Unknown Title'),
+            'uploader': info_dict.get('uploader', 'Unknown Uploader'),
+            'duration': info_dict.get('duration', 0),
+            'view_count': info_dict.get('view_count', 0),
+            'thumbnail': thumbnail or ''
+        }
+
+    @classmethod
+    def extract_video_info(cls, url: str) -> Dict[str, Any]:
         """
-        Extract metadata for a given video URL.
+        Extract summary metadata for a given video URL.
+        
+        Skips format processing, which the summary does not need.
         
         Args:
             url (str): Video URL to extract information from
@@ -27,27 +261,63 @@ class VideoMetadataExtractor:
         Returns:
             Dict containing video metadata
         """
+        cached = cls._cache_get(url)
+        if cached is not None:
+            return cached
+
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'skipdownload': True,
-            }
+            with YDLPool.get(cls.YDL_OPTS) as ydl:
+                info_dict = ydl.extract_info(url, download=False, process=False)
+                # Follow redirects and shortlinks, still without processing
+                for _ in range(MAX_URL_REDIRECTS):
+                    if info_dict.get('_type') not in ('url', 'url_transparent'):
+                        break
+                    outer = info_dict
+                    info_dict = ydl.extract_info(
+                        outer['url'], download=False, process=False, ie_key=outer.get('ie_key')
+                    )
+                    if outer['_type'] == 'url_transparent':
+                        # Fields set on the transparent wrapper take precedence
+                        info_dict = {**info_dict, **{
+                            k: v for k, v in outer.items()
+                            if v is not None and k not in _URL_TRANSPARENT_EXEMPT_FIELDS
+                        }}
+
+            if info_dict.get('_type') in ('url', 'url_transparent'):
+                return {'error': f"Could not resolve {url} within {MAX_URL_REDIRECTS} redirects"}
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info_dict = ydl.extract_info(url, download=False)
-                
-                return {
-                    'title': info_dict.get('title', 'Unknown Title'),
-                    'uploader': info_dict.get('uploader', 'Unknown Uploader'),
-                    'duration': info_dict.get('duration', 0),
-                    'view_count': info_dict.get('view_count', 0),
-                    'formats': info_dict.get('formats', []),
-                    'thumbnail': info_dict.get('thumbnail', '')
-                }
+            info = cls._summarize(info_dict)
         except Exception as e:
             return {'error': str(e)}
 
+        cls._cache_put(url, info)
+        return info
+
+    @classmethod
+    def extract_many(cls, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract metadata for several URLs on the shared YoutubeDL instance.
+        
+        Args:
+            urls (List[str]): Video URLs to extract information from
+        
+        Returns:
+            List of metadata dicts, in the same order as ``urls``
+        """
+        return [cls.extract_video_info(url) for url in urls]
+
+class MetadataFetchThread(QThread):
+    """Thread for fetching video metadata without blocking the UI."""
+    info_signal = pyqtSignal(dict)
+
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+
+    def run(self):
+        """Extract metadata and hand it back to the GUI thread."""
+        self.info_signal.emit(VideoMetadataExtractor.extract_video_info(self.url))
+
 class VideoDownloaderThread(QThread):
     """Thread for handling video downloads with advanced features."""
     finished_signal = pyqtSignal(str)
@@ -62,7 +332,9 @@ class VideoDownloaderThread(QThread):
         ffmpeg_location: Optional[str], 
         download_path: str,
         download_subtitles: bool = False,
-        download_thumbnail: bool = False
+        download_thumbnail: bool = False,
+        concurrent_fragments: Optional[int] = None,
+        aria2c_location: Optional[str] = None
     ):
         super().__init__()
         self.url = url
@@ -71,24 +343,21 @@ class VideoDownloaderThread(QThread):
         self.download_path = download_path
         self.download_subtitles = download_subtitles
         self.download_thumbnail = download_thumbnail
-        self.num_cores = max(1, multiprocessing.cpu_count() - 1)
+        self.concurrent_fragments: int = concurrent_fragments or _DEFAULT_CONCURRENT_FRAGS
+        self.aria2c_location = aria2c_location
+        self._height_filter = (
+            "" if self.quality == "Best Available" else f"[height<={self.quality[:-1]}]"
+        )
+        self._last_emit_ns = 0
+        self._last_percentage = -1
+        self._last_speed_tenths = -1
 
     def _get_format_option(self) -> str:
         """Optimize format selection for faster downloads."""
-        platforms = {
-            "youtube.com": lambda: 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]' 
-                if self.quality == "Best Available" 
-                else f'bestvideo[height<={self.quality[:-1]}][ext=mp4]+bestaudio[ext=m4a]/best[height<={self.quality[:-1]}][ext=mp4]',
-            "instagram.com": lambda: "best[ext=mp4]",
-            "vimeo.com": lambda: "best[ext=mp4]",
-            "facebook.com": lambda: "best[ext=mp4]"
-        }
-
-        for platform, format_func in platforms.items():
-            if platform in self.url:
-                return format_func()
-        
-        return "best[ext=mp4]"
+        match = _PLATFORM_RE.search(self.url)
+        if match is None:
+            return _DEFAULT_FORMAT
+        return _FORMAT_TABLE[match.group(1)].format(h=self._height_filter)
 
     def run(self):
         """Main download and conversion process."""
@@ -97,12 +366,6 @@ class VideoDownloaderThread(QThread):
             
             postprocessors = []
 
-            # Modify the video conversion postprocessor
-            postprocessors.append({
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mp4'
-            })
-
             # Add subtitle download if requested
             if self.download_subtitles:
                 postprocessors.append({
@@ -110,25 +373,57 @@ class VideoDownloaderThread(QThread):
                     'format': 'srt'
                 })
 
+            # Embed the thumbnail, fetched alongside the video, once it's done.
+            # Metadata goes first so ffmpeg doesn't rewrite the file after
+            # the cover is embedded (same order as yt-dlp's CLI).
+            if self.download_thumbnail:
+                postprocessors.append({'key': 'FFmpegMetadata'})
+                postprocessors.append({
+                    'key': 'EmbedThumbnail',
+                    'already_have_thumbnail': True  # keep the image file as well
+                })
+
             ydl_opts: Dict[str, Any] = {
                 'outtmpl': os.path.join(self.download_path, '%(title)s.%(ext)s'),
-                'progress_hooks': [self._progress_hook],
                 'format': format_option,
                 'ffmpeg_location': self.ffmpeg_location,
-                'concurrent_views': self.num_cores,
+                'concurrent_fragment_downloads': self.concurrent_fragments,
+                'http_chunk_size': 10 * 1024 * 1024,
                 'fragment_retries': 3,
-                'retries': 3,
                 'no_color': True,
                 'no_warnings': True,
                 'ignoreerrors': False,
-                'postprocessors': postprocessors,
+                'merge_output_format': 'mp4',
+                # Remux with "-c copy" rather than re-encoding into mp4
+                'postprocessors': [
+                    {'key': 'FFmpegVideoRemuxer', 'preferedformat': 'mp4'}
+                ] + postprocessors,
                 'writesubtitles': self.download_subtitles,
-                'socket_timeout': 30,
-                'force_generic_extractor': True
+                'allsubtitles': False,
+                'subtitleslangs': ['en.*'],
+                'writethumbnail': self.download_thumbnail,
+                'extractor_args': {'youtube': {'player_skip': ['configs']}}
             }
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([self.url])
+            # Hand off to aria2c for multi-connection segmented fetching
+            if self.aria2c_location:
+                ydl_opts['external_downloader'] = {'default': self.aria2c_location}
+                ydl_opts['external_downloader_args'] = {
+                    'aria2c': ['-x', '16', '-s', '16', '-k', '1M', '--file-allocation=none']
+                }
+
+            with YDLPool.get(ydl_opts) as ydl:
+                info_dict = ydl.extract_info(self.url, download=False)
+
+            # Only transcode when the selected video can't be copied into mp4
+            vcodec = info_dict.get('vcodec') or 'none'
+            if vcodec != 'none' and not vcodec.startswith(_MP4_VIDEO_CODECS):
+                ydl_opts['postprocessors'] = [
+                    {'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'}
+                ] + postprocessors
+
+            with YDLPool.get(ydl_opts, progress_hook=self._progress_hook) as ydl:
+                ydl.process_ie_result(info_dict, download=True)
             
             self.finished_signal.emit("Video downloaded and converted successfully.")
         
@@ -136,29 +431,56 @@ class VideoDownloaderThread(QThread):
             self.error_signal.emit(f"Download error: {str(e)}")
 
     def _progress_hook(self, d: Dict[str, Any]):
-        """Enhanced progress tracking with speed information."""
-        if d['status'] == 'downloading':
-            downloaded = d.get('downloaded_bytes', 0)
-            total = d.get('total_bytes_estimate', d.get('total_bytes', 0))
-            
-            if total > 0:
-                percentage = min(100, int((downloaded / total) * 100))
-                self.progress_signal.emit(percentage)
+        """Enhanced progress tracking with speed information.
+
+        yt-dlp calls this hook far more often than the GUI can repaint, so
+        updates are throttled to PROGRESS_EMIT_INTERVAL_NS, except for the
+        first and last callbacks of a download. Throttled calls return
+        before any arithmetic is done.
+        """
+        if d['status'] != 'downloading':
+            return
+
+        downloaded = d['downloaded_bytes'] if 'downloaded_bytes' in d else 0
+        total = d.get('total_bytes_estimate') or d.get('total_bytes') or 0
+
+        now = time.monotonic_ns()
+        in_progress = 0 < downloaded and (not total or downloaded < total)
+        if in_progress and now - self._last_emit_ns < PROGRESS_EMIT_INTERVAL_NS:
+            return
+        self._last_emit_ns = now
+
+        # Plain integer math is all this needs; a JIT such as Numba was
+        # considered, but its startup cost would dwarf a few divisions.
+        total = int(total)
+        percentage = min(100, int(downloaded) * 100 // total) if total > 0 else None
 
-            speed = d.get('speed', 0)
-            if speed:
-                speed_str = f"{speed/1024/1024:.2f} MB/s"
-                self.speed_signal.emit(speed_str)
+        if percentage is not None and percentage != self._last_percentage:
+            self._last_percentage = percentage
+            self.progress_signal.emit(percentage)
+
+        speed = d.get('speed', 0)
+        if speed:
+            # Speed in tenths of a MiB/s; only re-format when it changes
+            speed_tenths = (int(speed) * 10) >> 20
+            if speed_tenths != self._last_speed_tenths:
+                self._last_speed_tenths = speed_tenths
+                self.speed_signal.emit(f"{speed_tenths // 10}.{speed_tenths % 10} MB/s")
 
 class VideoDownloaderApp(QWidget):
     """Main application window for video downloading."""
     QUALITY_OPTIONS = ["360p", "480p", "720p", "1080p", "Best Available"]
-    RECENT_URLS_FILE = os.path.expanduser("~/.youtube_downloader_history.txt")
+    # Pre-QSettings history location, read once to migrate old installs
+    LEGACY_RECENT_URLS_FILE = os.path.expanduser("~/.youtube_downloader_history.txt")
+    MAX_RECENT_URLS = 10
     
-    def __init__(self):
+    def __init__(self, app_icon: Optional[QIcon] = None):
         super().__init__()
+        self.app_icon = app_icon
+        self._settings = QSettings("YTIVs", "Downloader")
         self._setup_ui()
-        self._load_recent_urls()
+        self._recent_urls = self._load_recent_urls()  # Newest first
+        self.recent_urls_combo.addItems(self._recent_urls)
 
     def _setup_ui(self):
         """Setup the main user interface."""
@@ -179,10 +501,10 @@ class VideoDownloaderApp(QWidget):
         url_layout = QHBoxLayout()
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("Enter video URL")
-        url_input_btn = QPushButton("Fetch Info")
-        url_input_btn.clicked.connect(self._fetch_video_info)
+        self.fetch_button = QPushButton("Fetch Info")
+        self.fetch_button.clicked.connect(self._fetch_video_info)
         url_layout.addWidget(self.url_input)
-        url_layout.addWidget(url_input_btn)
+        url_layout.addWidget(self.fetch_button)
         download_layout.addLayout(url_layout)
 
         # Recent URLs Dropdown
@@ -203,10 +525,23 @@ class VideoDownloaderApp(QWidget):
         options_layout = QHBoxLayout()
         self.subtitles_check = QCheckBox("Download Subtitles")
         self.thumbnail_check = QCheckBox("Download Thumbnail")
+        self.aria2c_check = QCheckBox("Use aria2c (faster)")
+        self.aria2c_check.setEnabled(shutil.which("aria2c") is not None)
         options_layout.addWidget(self.subtitles_check)
         options_layout.addWidget(self.thumbnail_check)
+        options_layout.addWidget(self.aria2c_check)
         download_layout.addLayout(options_layout)
 
+        # Parallel Fragment Downloads
+        fragments_layout = QHBoxLayout()
+        fragments_label = QLabel("Concurrent Fragments:")
+        self.fragments_spin = QSpinBox()
+        self.fragments_spin.setRange(1, 16)
+        self.fragments_spin.setValue(_DEFAULT_CONCURRENT_FRAGS)
+        fragments_layout.addWidget(fragments_label)
+        fragments_layout.addWidget(self.fragments_spin)
+        download_layout.addLayout(fragments_layout)
+
         # Download Folder Selection
         folder_layout = QHBoxLayout()
         self.folder_path_display = QLineEdit()
@@ -234,9 +569,15 @@ class VideoDownloaderApp(QWidget):
         # Video Info Tab
         info_tab = QWidget()
         info_layout = QVBoxLayout()
-        self.video_info_text = QTextEdit()
-        self.video_info_text.setReadOnly(True)
+        self.video_info_text = QLabel()
+        self.video_info_text.setTextFormat(Qt.RichText)
+        self.video_info_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.video_info_text.setAlignment(Qt.AlignTop)
+        self.video_info_text.setWordWrap(True)
         info_layout.addWidget(self.video_info_text)
+        self.refresh_button = QPushButton("Refresh metadata")
+        self.refresh_button.clicked.connect(self._refresh_video_info)
+        info_layout.addWidget(self.refresh_button)
         info_tab.setLayout(info_layout)
 
         # Add tabs
@@ -261,9 +602,19 @@ class VideoDownloaderApp(QWidget):
             self._show_message("Error", "Please enter a valid URL", QMessageBox.Critical)
             return
 
-        # Extract video metadata
-        info = VideoMetadataExtractor.extract_video_info(url)
-        
+        # Extract video metadata in the background
+        self.fetch_thread = MetadataFetchThread(url)
+        self.fetch_thread.info_signal.connect(self._on_info_ready)
+        self.fetch_thread.start()
+        self.fetch_button.setEnabled(False)
+        self.refresh_button.setEnabled(False)
+
+    def _on_info_ready(self, info: Dict[str, Any]):
+        """Display fetched video metadata."""
+        url = self.fetch_thread.url
+        self.fetch_button.setEnabled(True)
+        self.refresh_button.setEnabled(True)
+
         if 'error' in info:
             self._show_message("Error", info['error'], QMessageBox.Critical)
             return
@@ -272,40 +623,57 @@ class VideoDownloaderApp(QWidget):
         self.tab_widget.setCurrentIndex(1)
 
         # Display video info
-        info_text = f"""
-        Title: {info['title']}
-        Uploader: {info['uploader']}
-        Duration: {info['duration']} seconds
-        Views: {info['view_count']}
-        """
+        info_text = (
+            f"Title: {html.escape(str(info['title']))}<br>"
+            f"Uploader: {html.escape(str(info['uploader']))}<br>"
+            f"Duration: {info['duration']} seconds<br>"
+            f"Views: {info['view_count']}"
+        )
         self.video_info_text.setText(info_text)
 
         # Add to recent URLs
         self._add_to_recent_urls(url)
 
+    def _refresh_video_info(self):
+        """Discard cached metadata for the current URL and fetch it again."""
+        url = self.url_input.text().strip()
+        if url:
+            VideoMetadataExtractor.invalidate(url)
+        self._fetch_video_info()
+
     def _add_to_recent_urls(self, url: str):
         """Add URL to recent URLs list."""
-        recent_urls = self._load_recent_urls()
-        if url not in recent_urls:
-            recent_urls.insert(0, url)
-            recent_urls = recent_urls[:10]  # Keep last 10 URLs
-            
-            with open(self.RECENT_URLS_FILE, 'w') as f:
-                f.write('\n'.join(recent_urls))
-            
-            self.recent_urls_combo.clear()
-            self.recent_urls_combo.addItems(recent_urls)
+        if self._recent_urls and self._recent_urls[0] == url:
+            return
+
+        self.recent_urls_combo.blockSignals(True)
+        if url in self._recent_urls:
+            index = self._recent_urls.index(url)
+            del self._recent_urls[index]
+            self.recent_urls_combo.removeItem(index)
+
+        self._recent_urls.insert(0, url)
+        self.recent_urls_combo.insertItem(0, url)
+        while len(self._recent_urls) > self.MAX_RECENT_URLS:
+            self._recent_urls.pop()
+            self.recent_urls_combo.removeItem(self.MAX_RECENT_URLS)
+        self.recent_urls_combo.setCurrentIndex(0)
+        self.recent_urls_combo.blockSignals(False)
+
+        self._settings.setValue("recent_urls", self._recent_urls)
 
     def _load_recent_urls(self) -> List[str]:
-        """Load recent URLs from file."""
-        try:
-            with open(self.RECENT_URLS_FILE, 'r') as f:
-                urls = [line.strip() for line in f.readlines() if line.strip()]
-                self.recent_urls_combo.clear()
-                self.recent_urls_combo.addItems(urls)
-                return urls
-        except FileNotFoundError:
-            return []
+        """Load recent URLs from settings."""
+        if self._settings.contains("recent_urls"):
+            urls = self._settings.value("recent_urls", [], type=list)
+        else:
+            try:
+                with open(self.LEGACY_RECENT_URLS_FILE, 'r') as f:
+                    urls = [line.strip() for line in f.readlines() if line.strip()]
+            except FileNotFoundError:
+                urls = []
+
+        return urls[:self.MAX_RECENT_URLS]
 
     def _set_url_from_recent(self, url: str):
         """Set URL from recent URLs dropdown."""
@@ -314,11 +682,9 @@ class VideoDownloaderApp(QWidget):
 
     def _set_app_icon(self):
         """Set application icon."""
-        try:
-            self.setWindowIcon(QIcon("icon.ico"))  # Set window icon
-            self.setGeometry(100, 100, 800, 600)  # Set window size
-        except Exception as e:
-            print(f"Icon loading error: {e}")
+        if self.app_icon is not None:
+            self.setWindowIcon(self.app_icon)  # Set window icon
+        self.setGeometry(100, 100, 800, 600)  # Set window size
 
     def _select_folder(self):
         """Open folder selection dialog."""
@@ -345,6 +711,9 @@ class VideoDownloaderApp(QWidget):
             )
             return
 
+        # Find aria2c (optional)
+        aria2c_location = shutil.which("aria2c") if self.aria2c_check.isChecked() else None
+
         # Prepare download thread
         self.download_thread = VideoDownloaderThread(
             url=url,
@@ -352,7 +721,9 @@ class VideoDownloaderApp(QWidget):
             ffmpeg_location=ffmpeg_location,
             download_path=self.download_path,
             download_subtitles=self.subtitles_check.isChecked(),
-            download_thumbnail=self.thumbnail_check.isChecked()
+            download_thumbnail=self.thumbnail_check.isChecked(),
+            concurrent_fragments=self.fragments_spin.value(),
+            aria2c_location=aria2c_location
         )
 
         # Connect signals
@@ -396,10 +767,14 @@ def main():
     
     # Set application-wide style
     app.setStyle('Fusion')  # Modern, cross-platform look
-    app.setWindowIcon(QIcon("icon.ico"))
-    # Create and show the main window
+    # Decode the icon once and share it with every window
+    app_icon = None
+    if os.path.isfile(APP_ICON_FILE):
+        app_icon = QIcon(APP_ICON_FILE)
+        app.setWindowIcon(app_icon)
 
-    window = VideoDownloaderApp()
+    # Create and show the main window
+    window = VideoDownloaderApp(app_icon)
 
     window.show()
     